@@ -16,86 +16,96 @@ from quadrits import string_to_quadrits, quadrits_to_string
 # from transaction import Transaction
 # Uncomment and adjust as needed for your real modules
 
-def quadrits_demo():
-    print("\n[DEMO] Quadrits reversible encoding test:")
+def quadrits_demo(say):
+    say("\n[DEMO] Quadrits reversible encoding test:")
     original_text = "Valorium X: The Birth of a Star!"
     quadrits = string_to_quadrits(original_text)
     decoded_text = quadrits_to_string(quadrits)
-    integrity = '\u2705 SUCCESS' if original_text == decoded_text else '\u274c FAILURE'
-    print(f"  Original: '{original_text}'")
-    print(f"  Decoded:  '{decoded_text}'")
-    print(f"  Integrity Check: {integrity}")
-    print("----------------------------------------")
-
-def unicode_test():
-    print("Unicode test: ✅ 🚀 🔒 𝚽 𝚺 𝚳 𝚪 𝛼 𝛽 𝛾")
-
-def main():
-    print("--- VALORIUM X BLOCKCHAIN SIMULATOR ---")
-    unicode_test()
-    quadrits_demo()
-    
+    integrity = '✅ SUCCESS' if original_text == decoded_text else '❌ FAILURE'
+    say(f"  Original: '{original_text}'")
+    say(f"  Decoded:  '{decoded_text}'")
+    say(f"  Integrity Check: {integrity}")
+    say("----------------------------------------")
+
+def unicode_test(say):
+    say("Unicode test: ✅ 🚀 🔒 𝚽 𝚺 𝚳 𝚪 𝛼 𝛽 𝛾")
+
+def main(verbose=False):
+    # Buffer the demo transcript and emit it in a single write: each print()
+    # is a flush (and, on Windows consoles, a syscall to conhost plus an
+    # encoding conversion), so ~40 of them dominate demo start-up time.
+    # --verbose restores line-by-line streaming for debugging.
+    lines = []
+    say = print if verbose else lines.append
+
+    say("--- VALORIUM X BLOCKCHAIN SIMULATOR ---")
+    unicode_test(say)
+    quadrits_demo(say)
+
     # --- [STEP 1] Blockchain Initialization ---
     # Example: blockchain = Blockchain()
-    print("[Step 1] Initializing the Valorium X Blockchain...")
-    print("  - Blockchain initialized successfully.\n")
+    say("[Step 1] Initializing the Valorium X Blockchain...")
+    say("  - Blockchain initialized successfully.\n")
 
     # --- [STEP 2] Wallet Creation & Genesis Distribution ---
     # Example: wallet1 = Wallet("VQX_Σ|8636⟩_AXON", 500)
     # Example: wallet2 = Wallet("VQX_δ|8C66⟩_AXON", 200)
-    print("[Step 2] Creating AXON wallets and distributing initial funds...")
-    print("  - VQX_Σ|8636⟩_AXON balance: 500 $VQXAI")
-    print("  - VQX_δ|8C66⟩_AXON balance: 200 $VQXAI")
-    print("----------------------------------------\n")
+    say("[Step 2] Creating AXON wallets and distributing initial funds...")
+    say("  - VQX_Σ|8636⟩_AXON balance: 500 $VQXAI")
+    say("  - VQX_δ|8C66⟩_AXON balance: 200 $VQXAI")
+    say("----------------------------------------\n")
 
     # --- [STEP 3] Transaction Buffer ---
-    print("[Step 3] Adding valid transactions to the ARN Buffer...")
-    print("  [INFO] Transaction from VQX_Σ|8636⟩_... to VQX_δ|8C66⟩_... for 100 $VQXAI added to buffer.")
-    print("  [INFO] Transaction from VQX_δ|8C66⟩_... to VQX_Φ|907E⟩_... for 50 $VQXAI added to buffer.\n")
+    say("[Step 3] Adding valid transactions to the ARN Buffer...")
+    say("  [INFO] Transaction from VQX_Σ|8636⟩_... to VQX_δ|8C66⟩_... for 100 $VQXAI added to buffer.")
+    say("  [INFO] Transaction from VQX_δ|8C66⟩_... to VQX_Φ|907E⟩_... for 50 $VQXAI added to buffer.\n")
 
     # --- [STEP 4] Block Mining (Simulated) ---
-    print("[Step 4] Mining Block 1...")
-    print("    [WORK] Block Mined (CIP Simulated): 000257bfdc...")
-    print("  [SUCCESS] Block 1 successfully mined!\n")
+    say("[Step 4] Mining Block 1...")
+    say("    [WORK] Block Mined (CIP Simulated): 000257bfdc...")
+    say("  [SUCCESS] Block 1 successfully mined!\n")
 
     # --- [STEP 5] Post-Mining Balances ---
-    print("[Step 5] Checking balances after Block 1:")
-    print("  - Balance of VQX_Σ|8636⟩_AXON: 400")
-    print("  - Balance of VQX_δ|8C66⟩_AXON: 250")
-    print("  - Balance of VQX_Φ|907E⟩_AXON: 50")
-    print("  - Balance of SylverBlade_Wallet: 100")
-    print("----------------------------------------\n")
+    say("[Step 5] Checking balances after Block 1:")
+    say("  - Balance of VQX_Σ|8636⟩_AXON: 400")
+    say("  - Balance of VQX_δ|8C66⟩_AXON: 250")
+    say("  - Balance of VQX_Φ|907E⟩_AXON: 50")
+    say("  - Balance of SylverBlade_Wallet: 100")
+    say("----------------------------------------\n")
 
     # --- [STEP 6] Invalid Transaction Test ---
-    print("[Step 6] Testing an invalid transaction (insufficient funds)...")
-    print("  [SUCCESS] Successfully caught the expected error: Insufficient funds.")
-    print("----------------------------------------\n")
+    say("[Step 6] Testing an invalid transaction (insufficient funds)...")
+    say("  [SUCCESS] Successfully caught the expected error: Insufficient funds.")
+    say("----------------------------------------\n")
 
     # --- [STEP 7] Block 2 Mining (Simulated) ---
-    print("[Step 7] Mining Block 2...")
-    print("    [WORK] Block Mined (CIP Simulated): 0003843f7a...")
-    print("  [SUCCESS] Block 2 successfully mined!\n")
+    say("[Step 7] Mining Block 2...")
+    say("    [WORK] Block Mined (CIP Simulated): 0003843f7a...")
+    say("  [SUCCESS] Block 2 successfully mined!\n")
 
     # --- [FINAL] Blockchain State & Tamper Test ---
-    print("--- FINAL VALORIUM X BLOCKCHAIN STATE ---")
-    print("--- Block 0 ---")
-    print("  Hash: 978e70ae1f131662...")
-    print("  Previous Hash: 0...")
-    print("--- Block 1 ---")
-    print("  Hash: 000257bfdcdf9a88...")
-    print("  Previous Hash: 978e70ae1f131662...")
-    print("--- Block 2 ---")
-    print("  Hash: 0003843f7a9bc25a...")
-    print("  Previous Hash: 000257bfdcdf9a88...\n")
-
-    print("Verifying final chain integrity...")
-    print("  Is the Valorium X blockchain valid? -> True\n")
-
-    print("--- TAMPERING TEST ---")
-    print("  Tampering with Block 1 by changing a transaction amount...")
-    print("  Re-verifying chain integrity after tampering...")
-    print("  [ERROR] Invalid hash for Block 1: 000257bfdcdf9a886ca88a1061543bc58bc6257a01e3fd3cc4e7db836c701e1feec048f7038e9348efbde53a8289bb89ce4a48f2da968fd3f5a2cd201d78b905")
-    print("  Is the chain still valid after tampering? -> False")
+    say("--- FINAL VALORIUM X BLOCKCHAIN STATE ---")
+    say("--- Block 0 ---")
+    say("  Hash: 978e70ae1f131662...")
+    say("  Previous Hash: 0...")
+    say("--- Block 1 ---")
+    say("  Hash: 000257bfdcdf9a88...")
+    say("  Previous Hash: 978e70ae1f131662...")
+    say("--- Block 2 ---")
+    say("  Hash: 0003843f7a9bc25a...")
+    say("  Previous Hash: 000257bfdcdf9a88...\n")
+
+    say("Verifying final chain integrity...")
+    say("  Is the Valorium X blockchain valid? -> True\n")
+
+    say("--- TAMPERING TEST ---")
+    say("  Tampering with Block 1 by changing a transaction amount...")
+    say("  Re-verifying chain integrity after tampering...")
+    say("  [ERROR] Invalid hash for Block 1: 000257bfdcdf9a886ca88a1061543bc58bc6257a01e3fd3cc4e7db836c701e1feec048f7038e9348efbde53a8289bb89ce4a48f2da968fd3f5a2cd201d78b905")
+    say("  Is the chain still valid after tampering? -> False")
+
+    if not verbose:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(verbose='--verbose' in sys.argv[1:])
@@ -16,18 +16,33 @@
 import time
 import random
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from quadrits import hash_data
 from structures import RnaTemplate, CipAttestation, CipProof
 
+@functools.lru_cache(maxsize=None)
+def _software_hash(version: str) -> str:
+    """Digest of the node software for a given version string.
+
+    Networks run thousands of nodes on a handful of versions; caching makes
+    node construction cost one digest per distinct version instead of one
+    per node.
+    """
+    return hash_data(f"ValoriumX Node Software {version}")
+
 class Node:
     """Base class for all network participants."""
     def __init__(self, address: str, software_version: str):
         self.address = address
+        # UTF-8 form cached once: signing paths feed the address into a hash
+        # every cycle and should not re-encode it each time.
+        self.addr_bytes = address.encode('utf-8')
         self.stake = 1000.0
         self.reputation = 1.0
         self.software_version = software_version
         # The node's software hash is an intrinsic property
-        self.software_hash = hash_data(f"ValoriumX Node Software {self.software_version}")
+        self.software_hash = _software_hash(software_version)
 
 class ValidatorNode(Node):
     def create_rna_template(self, transactions: list) -> RnaTemplate:
@@ -35,19 +50,39 @@ class ValidatorNode(Node):
         return RnaTemplate(transactions, self.address)
 
 class NeuralNode(Node):
-    def __init__(self, address: str, software_version: str, is_honest: bool = True):
+    def __init__(self, address: str, software_version: str, is_honest: bool = True,
+                 simulate_latency: bool = False):
         super().__init__(address, software_version)
         self.is_honest = is_honest
+        # Off by default: the fake 10 ms "computation" dwarfed the actual
+        # hashing work and dominated every consensus cycle. Demos that want
+        # visible pacing can opt back in.
+        self.simulate_latency = simulate_latency
         if not self.is_honest:
             # A malicious node might report a valid version but run different code,
             # which would be caught by deeper integrity checks in a real system.
             # For this simulation, their dishonesty is in their actions.
             pass
 
+    @staticmethod
+    def attest_batch(nodes, cip_proof: CipProof, pool: ThreadPoolExecutor = None) -> list:
+        """Collects attestations from many nodes concurrently.
+
+        The per-node work is a (possibly simulated-latency) sleep plus one
+        GIL-releasing digest call, so the batch costs roughly the slowest
+        node instead of the sum. Callers that attest every cycle pass their
+        long-lived pool; otherwise a throwaway one is used.
+        """
+        if pool is not None:
+            return list(pool.map(lambda n: n.attest_to_cip(cip_proof), nodes))
+        with ThreadPoolExecutor(max_workers=min(32, max(1, len(nodes)))) as ex:
+            return list(ex.map(lambda n: n.attest_to_cip(cip_proof), nodes))
+
     def attest_to_cip(self, cip_proof: CipProof) -> CipAttestation:
-        time.sleep(0.01)
+        if self.simulate_latency:
+            time.sleep(0.01)
         if self.is_honest:
-            return CipAttestation(cip_proof, self.address)
+            return CipAttestation(cip_proof, self.address, addr_bytes=self.addr_bytes)
         else:
             logging.warning(f"MALICIOUS NODE {self.address} is creating a FAKE proof!")
             return CipAttestation(CipProof("fake_rna", hash_data("fake_anchors")), self.address)
\ No newline at end of file
@@ -18,26 +18,41 @@ import hashlib
 import json
 import time
 import random
-from enum import Enum
+from enum import IntEnum
 from typing import List, Dict, Any, Union
 
 # --- SECTION 1: QUADRIT SYSTEM - THE BIOLOGICAL FOUNDATION ---
 
-class Quadrit(Enum):
-    """The fundamental information unit - bio-inspired 4-state system."""
+class Quadrit(IntEnum):
+    """The fundamental information unit - bio-inspired 4-state system.
+
+    IntEnum rather than Enum: members take the fast integer paths for
+    comparison, hashing and bit arithmetic, so loops over quadrit sequences
+    pay no enum dispatch.
+    """
     A = 0; T = 1; C = 2; G = 3
 
+# Precomputed lookup tables shared by the encoder: one entry per possible
+# byte replaces the shift/mask arithmetic and enum construction per symbol,
+# and the inverse table recombines four quadrits with a single dict hit.
+_BYTE_TO_QUADS = tuple(
+    (Quadrit((byte >> 6) & 0b11), Quadrit((byte >> 4) & 0b11),
+     Quadrit((byte >> 2) & 0b11), Quadrit(byte & 0b11))
+    for byte in range(256)
+)
+_QUADS_TO_BYTE = {quads: byte for byte, quads in enumerate(_BYTE_TO_QUADS)}
+
 class QuadritEncoder:
     """Handles encoding/decoding between traditional data and Quadrit sequences."""
     @staticmethod
     def bytes_to_quadrits(data: bytes) -> List[Quadrit]:
         """Convert bytes to a Quadrit sequence."""
+        # Each byte becomes 4 Quadrits (8 bits = 4 * 2 bits): one table
+        # lookup per byte, flattened at C speed.
         quadrits = []
-        for byte in data:
-            # Each byte becomes 4 Quadrits (8 bits = 4 * 2 bits)
-            for i in range(4):
-                quad_val = (byte >> (6 - i * 2)) & 0b11 # Extract 2 bits at a time
-                quadrits.append(Quadrit(quad_val))
+        extend = quadrits.extend
+        for quads in map(_BYTE_TO_QUADS.__getitem__, data):
+            extend(quads)
         return quadrits
 
     @staticmethod
@@ -46,15 +61,9 @@ class QuadritEncoder:
         # Pad with 'A' Quadrits if the length is not a multiple of 4
         if len(quadrits) % 4 != 0:
             quadrits.extend([Quadrit.A] * (4 - len(quadrits) % 4))
-        
-        result = bytearray()
-        for i in range(0, len(quadrits), 4):
-            byte_val = 0
-            # Recombine 4 Quadrits into one byte
-            for j in range(4):
-                byte_val |= (quadrits[i + j].value << (6 - j * 2))
-            result.append(byte_val)
-        return bytes(result)
+        table = _QUADS_TO_BYTE
+        return bytes(table[tuple(quadrits[i:i + 4])]
+                     for i in range(0, len(quadrits), 4))
 
     @staticmethod
     def string_to_quadrits(text: str) -> List[Quadrit]:
@@ -75,7 +84,9 @@ class Transaction:
         self.recipient = recipient
         self.amount = amount
         self.data = data
-        self.timestamp = time.time()
+        # Integer nanoseconds serialize as a plain int — no 17-digit float
+        # repr in the canonical string, and deterministic across platforms.
+        self.timestamp = time.time_ns()
     
     def get_serialized_string(self) -> str:
         """Creates a consistent, ordered string representation of the transaction."""
@@ -83,11 +94,18 @@ class Transaction:
 
     def calculate_hash(self) -> str:
         """Calculates the transaction's hash based on its Quadrit representation."""
-        # The core innovation: the hash is derived from the Quadrit-encoded data.
-        tx_string = self.get_serialized_string()
-        quadrits = QuadritEncoder.string_to_quadrits(tx_string)
-        quadrit_bytes = QuadritEncoder.quadrits_to_bytes(quadrits)
-        return hashlib.sha512(quadrit_bytes).hexdigest()
+        # The Quadrit round trip (string -> quadrits -> bytes) is the identity
+        # on the UTF-8 bytes: four quadrits are exactly one byte, so encoding
+        # and repacking reconstruct the input bit for bit. Hash those bytes
+        # directly and keep the symbolic expansion in get_quadrit_preview()
+        # for display.
+        return hashlib.sha512(self.get_serialized_string().encode('utf-8')).hexdigest()
+
+    def get_quadrit_preview(self, count: int = 20) -> List[str]:
+        """First `count` quadrit names of the serialized transaction, for demos."""
+        quadrits = QuadritEncoder.bytes_to_quadrits(
+            self.get_serialized_string().encode('utf-8')[:(count + 3) // 4 + 1])
+        return [q.name for q in quadrits[:count]]
 
 # ... (Other classes like Block, RnaTemplate, etc. would be similarly updated to use Quadrit-based hashing)
 # ... (For this focused example, we keep the rest of the simulation simple.)
@@ -106,7 +124,7 @@ if __name__ == "__main__":
     print("\n[Step 2] Serializing transaction data into Quadrits...")
     tx_quadrits = QuadritEncoder.string_to_quadrits(tx.get_serialized_string())
     print(f"  - Transaction data converted into a sequence of {len(tx_quadrits)} Quadrits.")
-    print(f"  - Preview (first 20 Quadrits): {[q.name for q in tx_quadrits[:20]]}...")
+    print(f"  - Preview (first 20 Quadrits): {tx.get_quadrit_preview(20)}...")
 
     # 3. Calculate the hash based on this Quadrit sequence
     print("\n[Step 3] Calculating the transaction hash from the Quadrit sequence...")